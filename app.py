@@ -1,89 +1,197 @@
-import json
+import glob
+import math
 import os
-import re
-import html
+import tempfile
 from datetime import time, datetime, timedelta
 
+import numpy as np
+import orjson
 import pandas as pd
 import streamlit as st
 
+from helpers import build_card_html, build_fav_keys, fix_prices, fmt_time, parse_flags, safe_str_series
+
 st.set_page_config(page_title="Vegas Happy Hour Finder", layout="wide")
 st.title("🍸 Las Vegas Happy Hour Finder")
 
 DATA_FILE = "happy_hours_raw.csv"
+# Bump whenever load_data's output changes so stale Parquet caches are ignored.
+DATA_CACHE_VERSION = 14
 FAVORITES_FILE = "favorites.json"
+PAGE_SIZE = 50  # rows sent to the desktop table per page
 
-
-@st.cache_data
+DAY_FLAGS = {
+    "Sunday": "Is Sunday",
+    "Monday": "Is Monday",
+    "Tuesday": "Is Tuesday",
+    "Wednesday": "Is Wednesday",
+    "Thursday": "Is Thursday",
+    "Friday": "Is Friday",
+    "Saturday": "Is Saturday",
+}
+# Bit position of each day in the packed _day_mask column
+DAY_INDEX = {day: i for i, day in enumerate(DAY_FLAGS)}
+
+# Columns the app reads after loading; the rest of the CSV is not kept or cached.
+# Day flags are only kept packed in _day_mask.
+DATA_COLUMNS = [
+    "Location Zone",
+    "Casino",
+    "Restaurant",
+    "Day of Week",
+    "Start Time Clean",
+    "End Time Clean",
+    "Drinks",
+    "Food",
+    "Drink Min Price",
+    "Cheapest Drink",
+    "Cheapest Food Item",
+    "Is All Day",
+    "_start_min",
+    "_end_min",
+    "_day_mask",
+    "_fav_key",
+    "_casino_str",
+    "_restaurant_str",
+    "_card_html",
+]
+
+
+# Cached by reference (no per-rerun hashing/copy): treat the returned frame as read-only.
+@st.cache_resource
 def load_data(path: str) -> pd.DataFrame:
-    df = pd.read_csv(path)
-
-    # Normalize time columns
-    for col in ["Start Time Clean", "End Time Clean"]:
+    # Reuse the normalized Parquet copy when it is newer than the CSV
+    cache_path = f"{path}.v{DATA_CACHE_VERSION}.parquet"
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception:
+            pass
+
+    # Arrow's multi-threaded C++ parser; normalization below still coerces each column
+    df = pd.read_csv(path, engine="pyarrow")
+
+    # Normalize time columns, keeping minute-of-day (int16, -1 when missing) for
+    # vectorized filtering and the display string for the mobile cards
+    for col, min_col, str_col in [
+        ("Start Time Clean", "_start_min", "_start_str"),
+        ("End Time Clean", "_end_min", "_end_str"),
+    ]:
         if col in df.columns:
-            df[col] = pd.to_datetime(df[col], errors="coerce").dt.time
-
-    # Normalize day flags to real booleans
-    day_flag_cols = [
-        "Is Sunday",
-        "Is Monday",
-        "Is Tuesday",
-        "Is Wednesday",
-        "Is Thursday",
-        "Is Friday",
-        "Is Saturday",
-    ]
-    for col in day_flag_cols:
-        if col in df.columns:
-            df[col] = (
-                df[col]
-                .astype(str)
-                .str.strip()
-                .str.upper()
-                .isin(["TRUE", "T", "YES", "Y", "1"])
-            )
+            ts = pd.to_datetime(df[col], errors="coerce")
+            df[col] = ts.dt.time
+            df[min_col] = (ts.dt.hour * 60 + ts.dt.minute).fillna(-1).astype("int16")
+            df[str_col] = df[col].map(fmt_time)
+
+    # Normalize day flags to real booleans and pack them into one uint8 bitmask
+    # (bit DAY_INDEX[day] set when open that day)
+    flag_cols = [c for c in DAY_FLAGS.values() if c in df.columns]
+    # A missing flag column never filtered anything out, so its day counts as open
+    open_days = parse_flags(df[flag_cols]).reindex(columns=list(DAY_FLAGS.values()), fill_value=True)
+    df["_day_mask"] = np.packbits(open_days.to_numpy(dtype=bool), axis=1, bitorder="little")[:, 0]
 
     # Numeric helper
     if "Drink Min Price" in df.columns:
-        df["Drink Min Price"] = pd.to_numeric(df["Drink Min Price"], errors="coerce")
+        df["Drink Min Price"] = pd.to_numeric(df["Drink Min Price"], errors="coerce").astype("float32")
 
-    # All-day detection
+    # All-day detection (missing times carry the -1 sentinel, so they never match)
     df["Is All Day"] = False
-    if "Start Time Clean" in df.columns and "End Time Clean" in df.columns:
+    if "_start_min" in df.columns and "_end_min" in df.columns:
+        df["Is All Day"] = (df["_start_min"].to_numpy() == 0) & (df["_end_min"].to_numpy() >= 23 * 60)
+
+    df["_fav_key"] = build_fav_keys(df)
+
+    # Display-ready text for the mobile cards, cleaned once here instead of per card
+    for col, str_col in [
+        ("Location Zone", "_zone_str"),
+        ("Casino", "_casino_str"),
+        ("Restaurant", "_restaurant_str"),
+        ("Day of Week", "_day_str"),
+        ("Drinks", "_drinks_str"),
+        ("Food", "_food_str"),
+    ]:
+        if col in df.columns:
+            df[str_col] = safe_str_series(df[col])
+    # Missing $ signs added once per distinct drinks description
+    if "_drinks_str" in df.columns:
+        df["_drinks_str"] = df["_drinks_str"].map(fix_prices)
+    df["_card_html"] = build_card_html(df)
+
+    # Free-text columns as Arrow-backed strings (contiguous buffers, C string kernels)
+    for col in ["Restaurant", "Drinks", "Food", "Cheapest Drink", "Cheapest Food Item"]:
+        if col in df.columns:
+            df[col] = df[col].astype("string[pyarrow]")
 
-        def is_all_day(row):
-            start = row["Start Time Clean"]
-            end = row["End Time Clean"]
-            if pd.isna(start) or pd.isna(end):
-                return False
-            return start == time(0, 0) and end >= time(23, 0)
+    # Low-cardinality labels: compare, sort and unique() on integer codes
+    for col in ["Location Zone", "Casino", "Day of Week"]:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+
+    df = df[[c for c in DATA_COLUMNS if c in df.columns]]
 
-        df["Is All Day"] = df.apply(is_all_day, axis=1)
+    # Store rows in display order (zone, then cheapest drink) so filtered slices come
+    # out already sorted and reruns never sort
+    sort_by = [c for c in ["Location Zone", "Drink Min Price"] if c in df.columns]
+    if sort_by:
+        df = df.sort_values(by=sort_by, na_position="last", kind="stable").reset_index(drop=True)
+
+    try:
+        df.to_parquet(cache_path, engine="pyarrow", compression="zstd", index=False)
+        # Caches from other DATA_CACHE_VERSIONs are never read again
+        for stale_path in glob.glob(f"{glob.escape(path)}.v*.parquet"):
+            if stale_path != cache_path:
+                os.remove(stale_path)
+    except Exception:
+        pass
 
     return df
 
 
-def safe_str(val) -> str:
-    """Convert to clean string; hide NaN/None and normalize whitespace."""
-    if val is None or pd.isna(val):
-        return ""
-    text = str(val).replace("\n", " ").replace("\r", " ")
-    text = " ".join(text.split())
-    return text.strip()
+@st.cache_resource
+def fav_key_index(path: str) -> pd.Index:
+    """Index over the _fav_key column; its hash table is built once and reused across reruns."""
+    return pd.Index(load_data(path)["_fav_key"])
 
 
-def build_fav_key(row: pd.Series) -> str:
-    casino = safe_str(row.get("Casino"))
-    restaurant = safe_str(row.get("Restaurant"))
-    return f"{casino}::{restaurant}"
+@st.cache_data
+def sidebar_options(path: str) -> dict:
+    """Sidebar option lists and the price range, computed once per data file instead of per rerun."""
+    df = load_data(path)
+    options = {"zones": [], "casinos": [], "casinos_by_zone": {}, "price_range": None}
+    if "Location Zone" in df.columns:
+        options["zones"] = sorted(df["Location Zone"].dropna().unique().tolist())
+    if "Casino" in df.columns:
+        options["casinos"] = sorted(df["Casino"].dropna().unique().tolist())
+        if "Location Zone" in df.columns:
+            options["casinos_by_zone"] = {
+                zone: sorted(casinos.dropna().unique().tolist())
+                for zone, casinos in df.groupby("Location Zone", observed=True)["Casino"]
+            }
+    if "Drink Min Price" in df.columns:
+        valid = df["Drink Min Price"].dropna()
+        if not valid.empty:
+            # Prices are float32; round back to cents for clean slider labels
+            options["price_range"] = (round(float(valid.min()), 2), round(float(valid.max()), 2))
+    return options
 
 
 def load_favorites_from_file() -> dict:
     if not os.path.exists(FAVORITES_FILE):
         return {}
     try:
-        with open(FAVORITES_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        mtime = os.path.getmtime(FAVORITES_FILE)
+    except OSError:
+        return {}
+    return read_favorites_file(mtime)
+
+
+# Only the newest mtime is ever looked up again, so keep just that one parse
+@st.cache_data(max_entries=1)
+def read_favorites_file(mtime: float) -> dict:
+    """Parse favorites.json; keyed on its mtime so only a real file change re-reads it."""
+    try:
+        with open(FAVORITES_FILE, "rb") as f:
+            data = orjson.loads(f.read())
         if isinstance(data, dict):
             return data
     except Exception:
@@ -92,70 +200,146 @@ def load_favorites_from_file() -> dict:
 
 
 def save_favorites_to_file(favorites: dict) -> None:
+    # Write a uniquely named sibling temp file and swap it in, so readers never see a
+    # torn file and concurrent sessions (threads) never share a temp path
+    tmp_path = None
     try:
-        with open(FAVORITES_FILE, "w", encoding="utf-8") as f:
-            json.dump(favorites, f, ensure_ascii=False, indent=2)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=".favorites-", suffix=".tmp", dir=os.path.dirname(os.path.abspath(FAVORITES_FILE))
+        )
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(favorites, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, FAVORITES_FILE)
     except Exception:
-        pass
-
-
-def fmt_time(t) -> str:
-    if t is None or pd.isna(t):
-        return "—"
-    if isinstance(t, pd.Timestamp):
-        t = t.time()
-    try:
-        return t.strftime("%-I:%M %p")
-    except ValueError:
-        return t.strftime("%I:%M %p").lstrip("0")
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
 
-def fix_prices(text: str) -> str:
+def update_favorites(favorites: dict, shown_keys, checked_keys) -> bool:
     """
-    Add $ before obvious price numbers that are missing it.
-    Keeps quantity-like patterns untouched (e.g. '3 PBR').
+    Apply the favorite checkboxes of the rows on screen to the session favorites dict.
+    Favorites that are not shown (filtered out) are left alone; the file is only
+    rewritten when something was actually added or removed. Returns whether it was.
     """
-    if not text:
-        return text
-
-    s = text
-
-    # 1) Add $ before patterns like "5 24oz beer" (token starts with digits like 24oz)
-    # Example: "5 24oz beer" -> "$5 24oz beer"
-    s = re.sub(r"(?<!\$)\b(\d+)\b(?=\s+\d+oz\b)", r"$\1", s, flags=re.IGNORECASE)
-
-    # 2) General: number + word
-    # Example: "3 bottled beer" -> "$3 bottled beer"
-    # But: "3 PBR" should NOT get "$" (all caps short word)
-    pattern = re.compile(r"(?<!\$)\b(\d+(\.\d+)?)\b(\s+)([A-Za-z][A-Za-z0-9’'\-]*)")
-
-    def repl(m):
-        num = m.group(1)
-        space = m.group(3)
-        word = m.group(4)
-
-        # Don't convert "2-for-1" / "2-for-14" style pieces
-        # (we only see the first token, but if word is "for" skip)
-        if word.lower() == "for":
-            return f"{num}{space}{word}"
-
-        # Skip quantity shorthand like "3 PBR", "2 BOGO", etc.
-        if word.isupper() and len(word) <= 5:
-            return f"{num}{space}{word}"
+    checked = set(checked_keys)
+    to_add = checked - favorites.keys()
+    to_remove = (set(shown_keys) & favorites.keys()) - checked
+    for k in to_remove:
+        favorites.pop(k, None)
+    for k in to_add:
+        favorites[k] = {"tags": []}
+    if to_add or to_remove:
+        save_favorites_to_file(favorites)
+        return True
+    return False
+
+
+CARD_CSS = """<style>
+.hh-card {
+    border: 1px solid rgba(128, 128, 128, 0.3);
+    border-radius: 0.5rem;
+    padding: 0.6rem 0.9rem;
+    margin-bottom: 0.6rem;
+}
+.hh-card div { margin: 0.15rem 0; }
+</style>"""
+
+
+# Fragment: toggling a favorite (or paging the table) reruns only this section,
+# not the sidebar and filter pipeline above it.
+@st.fragment
+def render_results(sorted_df: pd.DataFrame, mobile_view: bool, show_favorites_only: bool) -> None:
+    # One read of the session dict; update_favorites edits this same object in place
+    favorites = st.session_state["favorites"]
+    changed = False
+
+    if mobile_view:
+        st.caption(
+            "📱 Mobile card view: tick ⭐ in the list below the cards, then press Save favorites "
+            "(stored in favorites.json on the server)."
+        )
 
-        # Otherwise, treat as price
-        return f"${num}{space}{word}"
+        # Card markup is prebuilt per row in load_data; all cards go out as one markdown element
+        cards = sorted_df.reindex(columns=["_fav_key", "_restaurant_str", "_casino_str", "_card_html"]).fillna("")
+        st.markdown(CARD_CSS + "".join(cards["_card_html"]), unsafe_allow_html=True)
+
+        # One favorites editor per venue shown, rather than a checkbox widget per card
+        venues = cards.drop_duplicates("_fav_key")
+        fav_df = pd.DataFrame(
+            {
+                "Favorite": venues["_fav_key"].isin(favorites.keys()).to_numpy(),
+                "Venue": (venues["_restaurant_str"] + " · " + venues["_casino_str"]).str.strip(" ·").to_numpy(),
+            },
+            index=venues["_fav_key"].to_numpy(),
+        )
+        # In a form, ticking several stars costs one rerun on Save instead of one per tick
+        with st.form("mobile_favorites", border=False):
+            edited_favs = st.data_editor(
+                fav_df,
+                use_container_width=True,
+                hide_index=True,
+                disabled=["Venue"],
+                column_config={"Favorite": st.column_config.CheckboxColumn("⭐")},
+            )
+            st.form_submit_button("Save favorites")
+        changed = update_favorites(favorites, edited_favs.index, edited_favs.index[edited_favs["Favorite"]])
 
-    s = pattern.sub(repl, s)
-    return s
+    else:
+        # Desktop table view
+        display_cols = [
+            "Location Zone",
+            "Casino",
+            "Restaurant",
+            "Day of Week",
+            "Start Time Clean",
+            "End Time Clean",
+            "Drinks",
+            "Food",
+            "Cheapest Drink",
+            "Cheapest Food Item",
+        ]
+        display_cols = [c for c in display_cols if c in sorted_df.columns]
+
+        # Only the current page is serialized to the browser
+        total_pages = math.ceil(len(sorted_df) / PAGE_SIZE)
+        page = 1
+        if total_pages > 1:
+            page = st.number_input(f"Page (of {total_pages})", min_value=1, max_value=total_pages, value=1, step=1)
+        page_df = sorted_df.iloc[(page - 1) * PAGE_SIZE : page * PAGE_SIZE]
+
+        # Shallow: only the index and a new column are set on it, never existing cells
+        display_df = page_df.loc[:, display_cols].copy(deep=False)
+        # Keys stay server-side: the editor returns rows in the order sent (UI sorting is
+        # view-only), so they map back by position, and a RangeIndex ships as metadata only
+        page_keys = page_df["_fav_key"].to_numpy()
+        display_df.index = pd.RangeIndex(len(display_df))
+
+        display_df["Favorite"] = page_df["_fav_key"].isin(favorites.keys()).to_numpy()
+
+        ordered_cols = ["Favorite", *display_cols]
+        display_df = display_df[ordered_cols]
+
+        edited_df = st.data_editor(
+            display_df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Favorite": st.column_config.CheckboxColumn("⭐ Favorite"),
+                "Start Time Clean": st.column_config.TimeColumn("Start Time", format="h:mm A"),
+                "End Time Clean": st.column_config.TimeColumn("End Time", format="h:mm A"),
+            },
+        )
 
+        if "Favorite" in edited_df.columns:
+            new_keys = page_keys[edited_df["Favorite"].to_numpy(dtype=bool)]
+            changed = update_favorites(favorites, page_keys, new_keys)
 
-def render_plain_line(emoji: str, text: str) -> None:
-    """
-    Render as plain HTML so Streamlit never interprets markdown/emphasis/code.
-    """
-    safe = html.escape(text)
-    st.markdown(f"<div style='margin: 0.15rem 0;'>{emoji} {safe}</div>", unsafe_allow_html=True)
+    # The favorites-only filter lives outside the fragment; refresh it when favorites change
+    if changed and show_favorites_only:
+        st.rerun()
 
 
 # ---------- Load data ----------
@@ -177,31 +361,23 @@ st.sidebar.header("Filters")
 
 mobile_view = st.sidebar.checkbox("Mobile view (compact cards)", value=False)
 
+options = sidebar_options(DATA_FILE)
+
 zone_col = "Location Zone"
 zone_choice = "Any"
 if zone_col in df.columns:
-    zone_options = ["Any"] + sorted(df[zone_col].dropna().unique().tolist())
+    zone_options = ["Any"] + options["zones"]
     zone_choice = st.sidebar.selectbox("Location Zone", zone_options, index=0)
 
 casino_col = "Casino"
 casino_choice = "Any"
 if casino_col in df.columns:
     if zone_choice != "Any" and zone_col in df.columns:
-        casino_base = df[df[zone_col] == zone_choice]
+        casino_options = ["Any"] + options["casinos_by_zone"].get(zone_choice, [])
     else:
-        casino_base = df
-    casino_options = ["Any"] + sorted(casino_base[casino_col].dropna().unique().tolist())
+        casino_options = ["Any"] + options["casinos"]
     casino_choice = st.sidebar.selectbox("Casino", casino_options, index=0)
 
-DAY_FLAGS = {
-    "Sunday": "Is Sunday",
-    "Monday": "Is Monday",
-    "Tuesday": "Is Tuesday",
-    "Wednesday": "Is Wednesday",
-    "Thursday": "Is Thursday",
-    "Friday": "Is Friday",
-    "Saturday": "Is Saturday",
-}
 day_options = ["Any"] + list(DAY_FLAGS.keys())
 
 default_time = time(19, 0)
@@ -273,64 +449,59 @@ all_day_only = st.sidebar.checkbox("Show only all-day happy hours", value=False)
 show_favorites_only = st.sidebar.checkbox("Show favorites only", value=False)
 
 max_drink_budget = None
-if "Drink Min Price" in df.columns:
-    valid = df["Drink Min Price"].dropna()
-    if not valid.empty:
-        max_drink_budget = st.sidebar.slider(
-            "Max cheapest drink ($)",
-            min_value=float(valid.min()),
-            max_value=float(valid.max()),
-            value=float(valid.max()),
-            step=1.0,
-        )
+if options["price_range"] is not None:
+    price_min, price_max = options["price_range"]
+    max_drink_budget = st.sidebar.slider(
+        "Max cheapest drink ($)",
+        min_value=price_min,
+        max_value=price_max,
+        value=price_max,
+        step=1.0,
+    )
 
 # ======================
 # Apply filters
 # ======================
-filtered = df.copy()
+# Every predicate ANDs into one row mask over df; the frame is sliced once at the end.
+mask = np.ones(len(df), dtype=bool)
 
-if zone_choice != "Any" and zone_col in filtered.columns:
-    filtered = filtered[filtered[zone_col] == zone_choice]
+if zone_choice != "Any" and zone_col in df.columns:
+    mask &= (df[zone_col] == zone_choice).to_numpy()
 
-if casino_choice != "Any" and casino_col in filtered.columns:
-    filtered = filtered[filtered[casino_col] == casino_choice]
+if casino_choice != "Any" and casino_col in df.columns:
+    mask &= (df[casino_col] == casino_choice).to_numpy()
 
-if all_day_only and "Is All Day" in filtered.columns:
-    filtered = filtered[filtered["Is All Day"] == True]
+if all_day_only and "Is All Day" in df.columns:
+    mask &= df["Is All Day"].to_numpy()
 
-if day_choice != "Any":
-    flag_col = DAY_FLAGS[day_choice]
-    if flag_col in filtered.columns:
-        filtered = filtered[filtered[flag_col] == True]
+if day_choice != "Any" and "_day_mask" in df.columns:
+    day_bit = np.uint8(1 << DAY_INDEX[day_choice])
+    mask &= (df["_day_mask"].to_numpy() & day_bit) != 0
 
 # Time window: END is EXCLUSIVE (so End=7:00 PM won't show at 7:00 PM)
-if "Start Time Clean" in filtered.columns and "End Time Clean" in filtered.columns:
-
-    def in_window(row):
-        start = row["Start Time Clean"]
-        end = row["End Time Clean"]
-        if pd.isna(start) or pd.isna(end):
-            return False
-        if start <= end:
-            return start <= selected_time < end
-        return (selected_time >= start) or (selected_time < end)
-
-    filtered = filtered[filtered.apply(in_window, axis=1)]
-
-if max_drink_budget is not None and "Drink Min Price" in filtered.columns:
-    filtered = filtered[
-        filtered["Drink Min Price"].notna()
-        & (filtered["Drink Min Price"] <= max_drink_budget)
-    ]
-
-favorites_dict = st.session_state.get("favorites", {})
-fav_keys = set(favorites_dict.keys())
+if "_start_min" in df.columns and "_end_min" in df.columns:
+    t = selected_time.hour * 60 + selected_time.minute
+    start_min = df["_start_min"].to_numpy()
+    end_min = df["_end_min"].to_numpy()
+    normal = (start_min <= end_min) & (start_min <= t) & (t < end_min)
+    overnight = (start_min > end_min) & ((t >= start_min) | (t < end_min))
+    mask &= (start_min >= 0) & (end_min >= 0) & (normal | overnight)
+
+if max_drink_budget is not None and "Drink Min Price" in df.columns:
+    # NaN compares False, so rows without a price drop out here too
+    # Compare in float32 so a budget equal to a listed price still matches it
+    mask &= df["Drink Min Price"].to_numpy() <= np.float32(max_drink_budget)
 
 if show_favorites_only:
-    if fav_keys:
-        filtered = filtered[filtered.apply(lambda r: build_fav_key(r) in fav_keys, axis=1)]
-    else:
-        filtered = filtered.iloc[0:0]
+    # Look the (few) favorites up in the cached key index instead of scanning every row
+    positions = fav_key_index(DATA_FILE).get_indexer_for(list(st.session_state["favorites"]))
+    fav_mask = np.zeros(len(df), dtype=bool)
+    fav_mask[positions[positions >= 0]] = True
+    mask &= fav_mask
+
+# Boolean indexing always copies; when nothing was filtered out, keep using the
+# shared (read-only) frame instead.
+filtered = df if mask.all() else df[mask]
 
 # ======================
 # Display
@@ -343,119 +514,5 @@ if filtered.empty:
 
 st.write(f"{len(filtered)} result(s)")
 
-sort_by = []
-ascending = []
-if "Location Zone" in filtered.columns:
-    sort_by.append("Location Zone")
-    ascending.append(True)
-if "Drink Min Price" in filtered.columns:
-    sort_by.append("Drink Min Price")
-    ascending.append(True)
-
-sorted_df = filtered.sort_values(by=sort_by, ascending=ascending, na_position="last") if sort_by else filtered
-
-favorites = st.session_state.get("favorites", {})
-
-if mobile_view:
-    st.caption("📱 Mobile card view: tap ⭐ to favorite (stored in favorites.json on the server).")
-
-    new_fav_keys = []
-
-    for idx, row in sorted_df.iterrows():
-        key = build_fav_key(row)
-        is_fav = key in favorites
-
-        restaurant = safe_str(row.get("Restaurant"))
-        casino = safe_str(row.get("Casino"))
-        zone = safe_str(row.get("Location Zone"))
-        day_label = safe_str(row.get("Day of Week"))
-
-        drinks_text = safe_str(row.get("Drinks"))
-        food_text = safe_str(row.get("Food"))
-
-        start_str = fmt_time(row.get("Start Time Clean"))
-        end_str = fmt_time(row.get("End Time Clean"))
-
-        with st.container(border=True):
-            col_text, col_fav = st.columns([6, 1])
-
-            with col_text:
-                parts = []
-                if zone:
-                    parts.append(f"**{zone}**")
-                if casino:
-                    parts.append(casino)
-                if restaurant:
-                    parts.append(restaurant)
-                st.markdown(" · ".join(parts) if parts else "Unknown location")
-
-            with col_fav:
-                fav_checked = st.checkbox(
-                    "⭐",
-                    value=is_fav,
-                    key=f"fav_mobile_{key}_{idx}",
-                    label_visibility="collapsed",
-                )
-
-            top_line_bits = []
-            if day_label:
-                top_line_bits.append(day_label)
-            top_line_bits.append(f"{start_str}–{end_str}")
-            st.markdown(" • ".join([b for b in top_line_bits if b]))
-
-            # Render drinks/food as PLAIN HTML text (no markdown parsing)
-            if drinks_text:
-                render_plain_line("🍹", fix_prices(drinks_text))
-
-            if food_text and food_text != "—":
-                render_plain_line("🍽️", food_text)
-
-            if fav_checked:
-                new_fav_keys.append(key)
-
-    # Save favorites from mobile view
-    old = st.session_state.get("favorites", {})
-    st.session_state["favorites"] = {k: old.get(k, {"tags": []}) for k in new_fav_keys}
-    save_favorites_to_file(st.session_state["favorites"])
-
-else:
-    # Desktop table view
-    display_cols = [
-        "Location Zone",
-        "Casino",
-        "Restaurant",
-        "Day of Week",
-        "Start Time Clean",
-        "End Time Clean",
-        "Drinks",
-        "Food",
-        "Cheapest Drink",
-        "Cheapest Food Item",
-    ]
-    display_cols = [c for c in display_cols if c in sorted_df.columns]
-
-    display_df = sorted_df[display_cols].copy()
-    display_df.index = sorted_df.apply(build_fav_key, axis=1)
-    display_df.index.name = "favorite_key"
-
-    display_df["Favorite"] = display_df.index.to_series().apply(lambda k: k in favorites)
-
-    ordered_cols = ["Favorite"] + [c for c in display_cols if c in display_df.columns]
-    display_df = display_df[ordered_cols]
-
-    edited_df = st.data_editor(
-        display_df,
-        use_container_width=True,
-        hide_index=True,
-        column_config={
-            "Favorite": st.column_config.CheckboxColumn("⭐ Favorite"),
-            "Start Time Clean": st.column_config.TimeColumn("Start Time", format="h:mm A"),
-            "End Time Clean": st.column_config.TimeColumn("End Time", format="h:mm A"),
-        },
-    )
-
-    if "Favorite" in edited_df.columns:
-        new_keys = edited_df.index[edited_df["Favorite"]].tolist()
-        old = st.session_state.get("favorites", {})
-        st.session_state["favorites"] = {k: old.get(k, {"tags": []}) for k in new_keys}
-        save_favorites_to_file(st.session_state["favorites"])
+# load_data stores rows in display order and the mask keeps it, so filtered is already sorted
+render_results(filtered, mobile_view, show_favorites_only)
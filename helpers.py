@@ -0,0 +1,131 @@
+"""
+Pure pandas/text helpers for the app.
+
+They live outside app.py because Streamlit re-executes the script on every rerun,
+while an imported module is loaded once per process: the compiled regexes and the
+fix_prices cache below survive across reruns and sessions.
+"""
+import re
+from functools import lru_cache
+
+import pandas as pd
+
+TRUE_VALUES = frozenset({"TRUE", "T", "YES", "Y", "1"})
+
+
+def parse_flags(flags: pd.DataFrame) -> pd.DataFrame:
+    """
+    Truthy flag columns to bool. Numeric/bool columns (the CSV's 0/1 case) are compared
+    to 1 in a single block op; only text columns go through the strip/upper/isin pipeline.
+    """
+    numeric = [c for c in flags.columns if pd.api.types.is_numeric_dtype(flags[c])]
+    out = flags[numeric].eq(1)
+    for col in flags.columns.difference(numeric, sort=False):
+        out[col] = flags[col].astype(str).str.strip().str.upper().isin(TRUE_VALUES)
+    return out[flags.columns]
+
+
+def safe_str_series(s: pd.Series) -> pd.Series:
+    """Convert a column to clean strings; hide NaN/None and normalize whitespace (incl. newlines)."""
+    return s.astype("string").fillna("").str.split().str.join(" ")
+
+
+def build_fav_keys(df: pd.DataFrame) -> pd.Series:
+    """Favorite key per row: '<casino>::<restaurant>'."""
+    blank = pd.Series("", index=df.index, dtype="string")
+    casino = safe_str_series(df["Casino"]) if "Casino" in df.columns else blank
+    restaurant = safe_str_series(df["Restaurant"]) if "Restaurant" in df.columns else blank
+    return casino + "::" + restaurant
+
+
+def _escape_html(s: pd.Series) -> pd.Series:
+    # Text only ever lands inside <div>s, so quotes need no escaping
+    s = s.str.replace("&", "&amp;", regex=False)
+    return s.str.replace("<", "&lt;", regex=False).str.replace(">", "&gt;", regex=False)
+
+
+def _join_nonblank(parts: list, sep: str) -> pd.Series:
+    """Row-wise sep.join() of the non-empty strings in parts."""
+    out = parts[0]
+    for p in parts[1:]:
+        out = (out.where(out == "", out + sep) + p).where(p != "", out)
+    return out
+
+
+def build_card_html(df: pd.DataFrame) -> pd.Series:
+    """
+    Mobile card markup per row, from the cleaned _*_str columns. All text is escaped so
+    Streamlit never interprets markdown/emphasis/code in it.
+    """
+    cols = [
+        "_zone_str",
+        "_casino_str",
+        "_restaurant_str",
+        "_day_str",
+        "_start_str",
+        "_end_str",
+        "_drinks_str",
+        "_food_str",
+    ]
+    text = df.reindex(columns=cols).astype("string").fillna({"_start_str": "—", "_end_str": "—"}).fillna("")
+    zone, casino, restaurant, day, start, end, drinks, food = (_escape_html(text[c]) for c in cols)
+
+    header = _join_nonblank([("<strong>" + zone + "</strong>").where(zone != "", ""), casino, restaurant], " · ")
+    header = header.where(header != "", "Unknown location")
+    timeline = _join_nonblank([day, start + "–" + end], " • ")
+    drinks_line = ("<div>🍹 " + drinks + "</div>").where(drinks != "", "")
+    food_line = ("<div>🍽️ " + food + "</div>").where(~food.isin(["", "—"]), "")
+
+    lines = "<div>" + header + "</div><div>" + timeline + "</div>" + drinks_line + food_line
+    return "<div class='hh-card'>" + lines + "</div>"
+
+
+def fmt_time(t) -> str:
+    if t is None or pd.isna(t):
+        return "—"
+    if isinstance(t, pd.Timestamp):
+        t = t.time()
+    # "%-I" is not portable (fails on Windows); strip the leading zero instead
+    return t.strftime("%I:%M %p").lstrip("0")
+
+
+# "5 24oz beer" -> "$5 24oz beer" (number followed by an oz size)
+_OZ_PRICE_RE = re.compile(r"(?<!\$)\b(\d+)\b(?=\s+\d+oz\b)", re.IGNORECASE)
+# number + word, e.g. "3 bottled beer"; _price_repl decides whether it is a price
+_PRICE_RE = re.compile(r"(?<!\$)\b(\d+(\.\d+)?)\b(\s+)([A-Za-z][A-Za-z0-9’'\-]*)")
+
+
+def _price_repl(m: re.Match) -> str:
+    num = m.group(1)
+    space = m.group(3)
+    word = m.group(4)
+
+    # Don't convert "2-for-1" / "2-for-14" style pieces
+    # (we only see the first token, but if word is "for" skip)
+    if word.lower() == "for":
+        return f"{num}{space}{word}"
+
+    # Skip quantity shorthand like "3 PBR", "2 BOGO", etc.
+    if word.isupper() and len(word) <= 5:
+        return f"{num}{space}{word}"
+
+    # Otherwise, treat as price
+    return f"${num}{space}{word}"
+
+
+@lru_cache(maxsize=4096)
+def fix_prices(text: str) -> str:
+    """
+    Add $ before obvious price numbers that are missing it.
+    Keeps quantity-like patterns untouched (e.g. '3 PBR').
+    """
+    if not text:
+        return text
+
+    # 1) Add $ before patterns like "5 24oz beer" (token starts with digits like 24oz)
+    s = _OZ_PRICE_RE.sub(r"$\1", text)
+
+    # 2) General: number + word
+    # Example: "3 bottled beer" -> "$3 bottled beer"
+    # But: "3 PBR" should NOT get "$" (all caps short word)
+    return _PRICE_RE.sub(_price_repl, s)